@@ -5,13 +5,12 @@ import logging
 import sys
 from pathlib import Path
 
-from feed_fetcher import fetch_rss_feed
-from formatter import format_for_notebooklm, format_as_json_summary
-from parser import parse_rss_feed
-
 # Default feed URL
 DEFAULT_FEED_URL = "https://feeds.feedburner.com/TheHackersNews"
 
+# Mirrors parser.SCHEMAS; duplicated so --help does not import the parser
+SCHEMAS = ("auto", "hn", "generic")
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -29,6 +28,12 @@ async def main_async(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, non-zero for error)
     """
+    # Imported here so argument parsing and --help skip httpx/lxml start-up
+    import feed_cache
+    from feed_fetcher import aclose_client, fetch_rss_feed
+    from formatter import format_as_json_summary, format_for_notebooklm
+    from parser import parse_rss_feed
+
     try:
         # Fetch feed
         logger.info(f"Fetching feed from {args.feed_url}")
@@ -36,11 +41,32 @@ async def main_async(args: argparse.Namespace) -> int:
             feed_url=args.feed_url,
             timeout=args.timeout,
             max_retries=args.retries,
+            use_cache=not args.no_cache,
         )
 
-        # Parse feed
-        logger.info("Parsing RSS feed content")
-        parsed_feed = parse_rss_feed(feed_content=feed_data["content"])
+        # Reuse the previous parse when the server reports no changes
+        parsed_feed = None
+        if feed_data["status_code"] == 304:
+            parsed_feed = feed_cache.load_parsed(
+                feed_url=args.feed_url, max_items=args.max_items
+            )
+
+        if parsed_feed is not None:
+            logger.info("Using cached parse of unchanged feed")
+        else:
+            # Parse feed
+            logger.info("Parsing RSS feed content")
+            parsed_feed = parse_rss_feed(
+                feed_content=feed_data["content"],
+                max_items=args.max_items,
+                schema=args.assume_schema,
+            )
+            if not args.no_cache:
+                feed_cache.store_parsed(
+                    feed_url=args.feed_url,
+                    parsed_feed=parsed_feed,
+                    max_items=args.max_items,
+                )
 
         logger.info(f"Found {len(parsed_feed.items)} news items")
 
@@ -48,25 +74,23 @@ async def main_async(args: argparse.Namespace) -> int:
         if args.format == "markdown":
             output = format_for_notebooklm(
                 parsed_feed=parsed_feed,
-                max_items=args.max_items,
                 include_metadata=not args.no_metadata,
             )
         elif args.format == "summary":
-            output = format_as_json_summary(
-                parsed_feed=parsed_feed,
-                max_items=args.max_items,
-            )
+            output = format_as_json_summary(parsed_feed=parsed_feed)
         else:
             logger.error(f"Unknown format: {args.format}")
             return 1
 
-        # Write output
+        # Write output as UTF-8 bytes in one call, bypassing the text I/O layer
+        data = output.encode("utf-8")
         if args.output:
             output_path = Path(args.output)
-            output_path.write_text(output, encoding="utf-8")
+            output_path.write_bytes(data)
             logger.info(f"Output written to {output_path}")
         else:
-            print(output)
+            sys.stdout.buffer.write(data + b"\n")
+            sys.stdout.buffer.flush()
 
         return 0
 
@@ -74,6 +98,9 @@ async def main_async(args: argparse.Namespace) -> int:
         logger.error(f"Error processing feed: {e}", exc_info=args.verbose)
         return 1
 
+    finally:
+        await aclose_client()
+
 
 def main() -> int:
     """Main entry point for CLI."""
@@ -110,6 +137,16 @@ def main() -> int:
         help="Maximum number of items to include (default: all)",
     )
 
+    parser.add_argument(
+        "--assume-schema",
+        choices=SCHEMAS,
+        default="auto",
+        help=(
+            "Item schema to assume: 'hn' uses The Hacker News fast path, 'generic' "
+            "parses any RSS 2.0 feed, 'auto' picks from the feed's link (default: auto)"
+        ),
+    )
+
     parser.add_argument(
         "--no-metadata",
         action="store_true",
@@ -130,6 +167,12 @@ def main() -> int:
         help="Maximum retry attempts (default: 3)",
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always download the full feed instead of revalidating the local cache",
+    )
+
     parser.add_argument(
         "--verbose",
         "-v",
@@ -142,7 +185,11 @@ def main() -> int:
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    return asyncio.run(main_async(args))
+    try:
+        import uvloop
+    except ImportError:  # Optional; not available on Windows
+        return asyncio.run(main_async(args))
+    return uvloop.run(main_async(args))
 
 
 if __name__ == "__main__":
@@ -1,8 +1,9 @@
 """Example usage of the RSS feed tool programmatically."""
 import asyncio
 import logging
+from pathlib import Path
 
-from feed_fetcher import fetch_rss_feed
+from feed_fetcher import aclose_client, fetch_rss_feed
 from formatter import format_for_notebooklm
 from parser import parse_rss_feed
 
@@ -13,8 +14,11 @@ async def example_fetch_and_format():
     """Example: Fetch and format RSS feed programmatically."""
     feed_url = "https://feeds.feedburner.com/TheHackersNews"
 
-    # Fetch the feed
-    feed_data = await fetch_rss_feed(feed_url=feed_url)
+    # Fetch the feed (the shared HTTP client is closed once we're done)
+    try:
+        feed_data = await fetch_rss_feed(feed_url=feed_url)
+    finally:
+        await aclose_client()
 
     # Parse the feed
     parsed_feed = parse_rss_feed(feed_content=feed_data["content"])
@@ -27,8 +31,7 @@ async def example_fetch_and_format():
     )
 
     # Save to file
-    with open("hacker_news_latest.md", "w", encoding="utf-8") as f:
-        f.write(markdown_output)
+    Path("hacker_news_latest.md").write_bytes(markdown_output.encode("utf-8"))
 
     print(f"✓ Fetched {len(parsed_feed.items)} items")
     print(f"✓ Saved latest 10 items to hacker_news_latest.md")
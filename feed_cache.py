@@ -0,0 +1,213 @@
+"""On-disk cache of feed bodies, parsed feeds and HTTP validators."""
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from parser import ParsedFeed
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "cybernews"
+
+_VALIDATORS_FILE = "etags.json"
+
+
+def _cache_key(feed_url: str) -> str:
+    """Return a filesystem-safe key for a feed URL."""
+    return hashlib.sha256(feed_url.encode("utf-8")).hexdigest()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write bytes to path via a temporary file so readers never see partial data."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _load_validators(cache_dir: Path) -> dict[str, dict[str, str]]:
+    """Load the URL -> validators mapping, tolerating a missing or corrupt file."""
+    try:
+        return json.loads((cache_dir / _VALIDATORS_FILE).read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable feed cache index: {e}")
+        return {}
+
+
+def conditional_headers(
+    *, feed_url: str, cache_dir: Path = DEFAULT_CACHE_DIR
+) -> dict[str, str]:
+    """
+    Build If-None-Match / If-Modified-Since headers for a cached feed.
+
+    Headers are only returned when the cached body is still on disk, so a
+    304 response can always be served from the cache.
+
+    Args:
+        feed_url: URL of the RSS feed
+        cache_dir: Cache directory
+
+    Returns:
+        Conditional request headers (empty if nothing is cached)
+    """
+    key = _cache_key(feed_url)
+    if not (cache_dir / f"{key}.xml").is_file():
+        return {}
+
+    validators = _load_validators(cache_dir).get(key, {})
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def load_content(*, feed_url: str, cache_dir: Path = DEFAULT_CACHE_DIR) -> Optional[bytes]:
+    """
+    Load the cached body of a feed.
+
+    Args:
+        feed_url: URL of the RSS feed
+        cache_dir: Cache directory
+
+    Returns:
+        Cached feed bytes, or None if not cached
+    """
+    try:
+        return (cache_dir / f"{_cache_key(feed_url)}.xml").read_bytes()
+    except OSError:
+        return None
+
+
+def store_content(
+    *,
+    feed_url: str,
+    content: bytes,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+) -> None:
+    """
+    Persist a feed body and its validators.
+
+    When the server sent neither ETag nor Last-Modified the response cannot
+    be revalidated, so any previously cached entry for the URL is evicted
+    instead.
+
+    Args:
+        feed_url: URL of the RSS feed
+        content: Feed body bytes
+        etag: ETag response header, if any
+        last_modified: Last-Modified response header, if any
+        cache_dir: Cache directory
+    """
+    key = _cache_key(feed_url)
+    try:
+        # A parsed copy of the previous body no longer matches
+        (cache_dir / f"{key}.pickle").unlink(missing_ok=True)
+        validators = _load_validators(cache_dir)
+
+        if not etag and not last_modified:
+            (cache_dir / f"{key}.xml").unlink(missing_ok=True)
+            if validators.pop(key, None) is None:
+                return
+        else:
+            _atomic_write(cache_dir / f"{key}.xml", content)
+            validators[key] = {
+                "url": feed_url,
+                "etag": etag or "",
+                "last_modified": last_modified or "",
+            }
+
+        _atomic_write(
+            cache_dir / _VALIDATORS_FILE, json.dumps(validators, indent=2).encode("utf-8")
+        )
+    except OSError as e:
+        logger.warning(f"Failed to write feed cache: {e}")
+
+
+def _normalize_limit(max_items: Optional[int]) -> Optional[int]:
+    """Map the "all items" spellings of max_items (None, <= 0) to None."""
+    return max_items if max_items is not None and max_items > 0 else None
+
+
+def load_parsed(
+    *,
+    feed_url: str,
+    max_items: Optional[int] = None,
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+) -> Optional["ParsedFeed"]:
+    """
+    Load the parsed copy of a cached feed body.
+
+    Args:
+        feed_url: URL of the RSS feed
+        max_items: Number of items needed (None or <= 0 for all)
+        cache_dir: Cache directory
+
+    Returns:
+        The cached ParsedFeed truncated to max_items, or None if nothing is
+        cached or the cached parse stopped short of max_items
+    """
+    path = cache_dir / f"{_cache_key(feed_url)}.pickle"
+    try:
+        cached_limit, parsed_feed = pickle.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # Corrupt, or written by an incompatible version
+        logger.warning(f"Ignoring unreadable parsed feed cache: {e}")
+        return None
+
+    limit = _normalize_limit(max_items)
+    if cached_limit is not None and (limit is None or limit > cached_limit):
+        return None
+    if limit is not None:
+        parsed_feed = dataclasses.replace(parsed_feed, items=parsed_feed.items[:limit])
+    return parsed_feed
+
+
+def store_parsed(
+    *,
+    feed_url: str,
+    parsed_feed: "ParsedFeed",
+    max_items: Optional[int] = None,
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+) -> None:
+    """
+    Persist the parsed form of the currently cached feed body.
+
+    Skipped when no body is cached, since the server can then never answer
+    304 and the parsed copy would not be used.
+
+    Args:
+        feed_url: URL of the RSS feed
+        parsed_feed: Result of parsing the cached body
+        max_items: max_items the feed was parsed with (None or <= 0 for all)
+        cache_dir: Cache directory
+    """
+    key = _cache_key(feed_url)
+    if not (cache_dir / f"{key}.xml").is_file():
+        return
+
+    data = pickle.dumps(
+        (_normalize_limit(max_items), parsed_feed), protocol=pickle.HIGHEST_PROTOCOL
+    )
+    try:
+        _atomic_write(cache_dir / f"{key}.pickle", data)
+    except OSError as e:
+        logger.warning(f"Failed to write parsed feed cache: {e}")
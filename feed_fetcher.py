@@ -1,18 +1,182 @@
 """RSS feed fetcher module for cybersecurity news."""
+import asyncio
 import logging
+import random
 from typing import Optional
 from urllib.parse import urlparse
 
 import httpx
 
+import feed_cache
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on simultaneous connections from the shared client
+_MAX_CONNECTIONS = 64
+
+# Retry backoff: base * 2**(attempt - 1), capped, plus random jitter (seconds)
+_BACKOFF_BASE = 0.5
+_BACKOFF_CAP = 30.0
+_BACKOFF_JITTER = 0.5
+
+# 4xx responses worth retrying; all 5xx responses are retried
+_RETRYABLE_CLIENT_ERRORS = frozenset({408, 429})
+# Responses whose Retry-After header is honoured
+_RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+
+# Sent with every request. Accept-Encoding is left to httpx, which advertises
+# gzip/deflate and adds br when the brotli extra is installed, so compressed
+# bodies are always decodable.
+_DEFAULT_HEADERS = {
+    "User-Agent": "cybernewsapp/1.0",
+    "Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8",
+}
+
+# Shared client so repeated fetches reuse pooled keep-alive connections.
+# httpx clients are bound to the event loop they were first used on, so the
+# loop is tracked and the client recreated if a new loop is running.
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client for the running event loop."""
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            headers=_DEFAULT_HEADERS,
+            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=_MAX_CONNECTIONS,
+                max_keepalive_connections=20,
+                keepalive_expiry=30,
+            ),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared HTTP client. Call before the event loop shuts down."""
+    global _client, _client_loop
+
+    if _client is not None and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
+
+def _is_retryable_status(status_code: int) -> bool:
+    """Return True for HTTP statuses that may succeed on a later attempt."""
+    return status_code >= 500 or status_code in _RETRYABLE_CLIENT_ERRORS
+
+
+def _retry_delay(*, attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """
+    Compute how long to wait before retrying.
+
+    Uses the server's numeric Retry-After header on 429/503 responses,
+    otherwise exponential backoff with jitter. Both are capped at
+    _BACKOFF_CAP seconds.
+    """
+    if response is not None and response.status_code in _RETRY_AFTER_STATUS_CODES:
+        retry_after = response.headers.get("Retry-After", "").strip()
+        if retry_after.isdigit():
+            return min(_BACKOFF_CAP, float(retry_after))
+
+    backoff = min(_BACKOFF_CAP, _BACKOFF_BASE * (2 ** (attempt - 1)))
+    return backoff + random.uniform(0, _BACKOFF_JITTER)
+
+
+async def _fetch_with_client(
+    *,
+    client: httpx.AsyncClient,
+    feed_url: str,
+    timeout: float,
+    max_retries: int,
+    use_cache: bool = False,
+) -> dict[str, str | bytes]:
+    """Fetch a single feed with retries using the given client."""
+    if not feed_url or not isinstance(feed_url, str):
+        raise ValueError("feed_url must be a non-empty string")
+
+    parsed = urlparse(feed_url)
+    if not parsed.scheme or not parsed.netloc:
+        raise ValueError(f"Invalid URL format: {feed_url}")
+
+    logger.info(f"Fetching RSS feed from {feed_url}")
+
+    headers = feed_cache.conditional_headers(feed_url=feed_url) if use_cache else {}
+
+    for attempt in range(1, max_retries + 1):
+        try:
+            response = await client.get(feed_url, headers=headers, timeout=timeout)
+
+            if response.status_code == 304:
+                content = feed_cache.load_content(feed_url=feed_url)
+                if content is not None:
+                    logger.info("Feed not modified, using cached copy")
+                    return {
+                        "content": content,
+                        "url": str(response.url),
+                        "status_code": response.status_code,
+                    }
+                # Cache vanished since the headers were built; refetch unconditionally
+                headers = {}
+                response = await client.get(feed_url, timeout=timeout)
+
+            response.raise_for_status()
+
+            logger.info(
+                f"Successfully fetched feed: {response.status_code} "
+                f"({len(response.content)} bytes)"
+            )
+
+            if use_cache:
+                feed_cache.store_content(
+                    feed_url=feed_url,
+                    content=response.content,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+
+            return {
+                "content": response.content,
+                "url": str(response.url),
+                "status_code": response.status_code,
+            }
+
+        except httpx.HTTPStatusError as e:
+            logger.warning(
+                f"HTTP error on attempt {attempt}/{max_retries}: "
+                f"{e.response.status_code}"
+            )
+            if attempt == max_retries or not _is_retryable_status(e.response.status_code):
+                raise
+            delay = _retry_delay(attempt=attempt, response=e.response)
+        except httpx.RequestError as e:
+            logger.warning(
+                f"Request error on attempt {attempt}/{max_retries}: {e}"
+            )
+            if attempt == max_retries:
+                raise
+            delay = _retry_delay(attempt=attempt)
+
+        logger.debug(f"Retrying {feed_url} in {delay:.2f}s")
+        await asyncio.sleep(delay)
+
+    raise httpx.HTTPError("Failed to fetch feed after all retries")
+
 
 async def fetch_rss_feed(
     *,
     feed_url: str,
     timeout: float = 30.0,
     max_retries: int = 3,
+    use_cache: bool = False,
 ) -> dict[str, str | bytes]:
     """
     Fetch RSS feed content from a given URL.
@@ -20,54 +184,69 @@ async def fetch_rss_feed(
     Args:
         feed_url: URL of the RSS feed to fetch
         timeout: Request timeout in seconds
-        max_retries: Maximum number of retry attempts
+        max_retries: Maximum number of attempts; network errors, 5xx, 408 and
+            429 responses are retried with exponential backoff
+        use_cache: Revalidate against the on-disk cache with ETag /
+            Last-Modified and serve the cached body on a 304 response
 
     Returns:
-        Dictionary with 'content' (bytes), 'url' (str), and 'status_code' (int)
+        Dictionary with 'content' (bytes), 'url' (str), and 'status_code' (int);
+        status_code is 304 when content came from the cache
 
     Raises:
         httpx.HTTPError: On network or HTTP errors
         ValueError: On invalid URL format
     """
-    if not feed_url or not isinstance(feed_url, str):
-        raise ValueError("feed_url must be a non-empty string")
+    return await _fetch_with_client(
+        client=_get_client(),
+        feed_url=feed_url,
+        timeout=timeout,
+        max_retries=max_retries,
+        use_cache=use_cache,
+    )
 
-    parsed = urlparse(feed_url)
-    if not parsed.scheme or not parsed.netloc:
-        raise ValueError(f"Invalid URL format: {feed_url}")
 
-    logger.info(f"Fetching RSS feed from {feed_url}")
+async def fetch_rss_feeds(
+    *,
+    feed_urls: list[str],
+    timeout: float = 30.0,
+    max_retries: int = 3,
+    concurrency: int = 10,
+    use_cache: bool = False,
+) -> list[dict[str, str | bytes] | BaseException]:
+    """
+    Fetch several RSS feeds concurrently over one shared client.
 
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-        for attempt in range(1, max_retries + 1):
-            try:
-                response = await client.get(feed_url)
-                response.raise_for_status()
+    Args:
+        feed_urls: URLs of the RSS feeds to fetch
+        timeout: Request timeout in seconds
+        max_retries: Maximum number of retry attempts per feed
+        concurrency: Maximum number of feeds fetched at the same time
+        use_cache: Revalidate each feed against the on-disk cache
 
-                logger.info(
-                    f"Successfully fetched feed: {response.status_code} "
-                    f"({len(response.content)} bytes)"
-                )
+    Returns:
+        One entry per URL, in input order: the same dictionary returned by
+        fetch_rss_feed, or the exception raised while fetching that feed
 
-                return {
-                    "content": response.content,
-                    "url": str(response.url),
-                    "status_code": response.status_code,
-                }
+    Raises:
+        ValueError: If concurrency is less than 1
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
 
-            except httpx.HTTPStatusError as e:
-                logger.warning(
-                    f"HTTP error on attempt {attempt}/{max_retries}: "
-                    f"{e.response.status_code}"
-                )
-                if attempt == max_retries:
-                    raise
-            except httpx.RequestError as e:
-                logger.warning(
-                    f"Request error on attempt {attempt}/{max_retries}: {e}"
-                )
-                if attempt == max_retries:
-                    raise
+    client = _get_client()
+    semaphore = asyncio.Semaphore(concurrency)
 
-    raise httpx.HTTPError("Failed to fetch feed after all retries")
+    async def fetch_one(feed_url: str) -> dict[str, str | bytes]:
+        async with semaphore:
+            return await _fetch_with_client(
+                client=client,
+                feed_url=feed_url,
+                timeout=timeout,
+                max_retries=max_retries,
+                use_cache=use_cache,
+            )
 
+    return await asyncio.gather(
+        *(fetch_one(feed_url) for feed_url in feed_urls), return_exceptions=True
+    )
@@ -1,12 +1,31 @@
 """Formatter module for converting parsed feeds to NotebookLM-compatible formats."""
+import io
 import logging
+import re
 from datetime import datetime
+from html import unescape
 from typing import Optional
 
+import orjson
+
 from parser import NewsItem, ParsedFeed
 
 logger = logging.getLogger(__name__)
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# Per-item markdown layout; optional blocks are pre-rendered (or empty) by the caller
+_MARKDOWN_ITEM_TEMPLATE = (
+    "## {idx}. {title}\n\n"
+    "{pub_date_block}"
+    "{description_block}"
+    "**Link:** {link}\n\n"
+    "{author_block}"
+    "{categories_block}"
+    "---\n\n"
+)
+
 
 def format_for_notebooklm(
     *,
@@ -25,57 +44,50 @@ def format_for_notebooklm(
     Returns:
         Formatted markdown string
     """
-    lines = []
+    buf = io.StringIO()
 
     if include_metadata:
-        lines.append("# Cybersecurity News Feed")
-        lines.append("")
-        lines.append(f"**Source:** {parsed_feed.metadata.title}")
-        if parsed_feed.metadata.description:
-            lines.append(f"**Description:** {parsed_feed.metadata.description}")
-        if parsed_feed.metadata.link:
-            lines.append(f"**Website:** {parsed_feed.metadata.link}")
-        if parsed_feed.metadata.last_build_date:
-            lines.append(
-                f"**Last Updated:** {parsed_feed.metadata.last_build_date.strftime('%Y-%m-%d %H:%M:%S UTC')}"
-            )
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        metadata = parsed_feed.metadata
+        buf.write("# Cybersecurity News Feed\n\n")
+        buf.write(f"**Source:** {metadata.title}\n")
+        if metadata.description:
+            buf.write(f"**Description:** {metadata.description}\n")
+        if metadata.link:
+            buf.write(f"**Website:** {metadata.link}\n")
+        if metadata.last_build_date:
+            buf.write(f"**Last Updated:** {_fmt_dt(metadata.last_build_date)}\n")
+        buf.write("\n---\n\n")
 
     items = parsed_feed.items
     if max_items is not None and max_items > 0:
         items = items[:max_items]
 
     for idx, item in enumerate(items, 1):
-        lines.append(f"## {idx}. {item.title}")
-        lines.append("")
-
-        if item.pub_date:
-            lines.append(f"**Published:** {item.pub_date.strftime('%Y-%m-%d %H:%M:%S UTC')}")
-            lines.append("")
-
-        if item.description:
-            # Clean up HTML tags from description (basic removal)
-            description = _clean_html(item.description)
-            lines.append(description)
-            lines.append("")
-
-        lines.append(f"**Link:** {item.link}")
-        lines.append("")
-
-        if item.author:
-            lines.append(f"**Author:** {item.author}")
-            lines.append("")
-
-        if item.categories:
-            lines.append(f"**Categories:** {', '.join(item.categories)}")
-            lines.append("")
-
-        lines.append("---")
-        lines.append("")
+        buf.write(
+            _MARKDOWN_ITEM_TEMPLATE.format(
+                idx=idx,
+                title=item.title,
+                pub_date_block=(
+                    f"**Published:** {_fmt_dt(item.pub_date)}\n\n"
+                    if item.pub_date
+                    else ""
+                ),
+                # Clean up HTML tags from description (basic removal)
+                description_block=(
+                    f"{_clean_html(item.description)}\n\n" if item.description else ""
+                ),
+                link=item.link,
+                author_block=f"**Author:** {item.author}\n\n" if item.author else "",
+                categories_block=(
+                    f"**Categories:** {', '.join(item.categories)}\n\n"
+                    if item.categories
+                    else ""
+                ),
+            )
+        )
 
-    return "\n".join(lines)
+    # Drop the final newline to keep the layout of a newline-joined list of lines
+    return buf.getvalue()[:-1]
 
 
 def format_as_json_summary(
@@ -84,38 +96,43 @@ def format_as_json_summary(
     max_items: Optional[int] = None,
 ) -> str:
     """
-    Format parsed feed as a JSON-like summary for NotebookLM.
+    Format parsed feed as a JSON summary for NotebookLM.
 
     Args:
         parsed_feed: Parsed feed data
         max_items: Maximum number of items to include
 
     Returns:
-        Formatted text summary
+        JSON document (2-space indented) with the feed title, item count and
+        one entry per article: title, date (ISO YYYY-MM-DD or null), url and
+        a plain-text summary truncated to 200 characters
     """
     items = parsed_feed.items
     if max_items is not None and max_items > 0:
         items = items[:max_items]
 
-    lines = [
-        f"Feed: {parsed_feed.metadata.title}",
-        f"Total Items: {len(items)}",
-        "",
-        "Articles:",
-        "",
-    ]
-
-    for idx, item in enumerate(items, 1):
-        lines.append(f"{idx}. {item.title}")
-        if item.pub_date:
-            lines.append(f"   Date: {item.pub_date.strftime('%Y-%m-%d')}")
-        lines.append(f"   URL: {item.link}")
-        if item.description:
-            desc = _clean_html(item.description)[:200] + "..."
-            lines.append(f"   Summary: {desc}")
-        lines.append("")
-
-    return "\n".join(lines)
+    payload = {
+        "feed": parsed_feed.metadata.title,
+        "total_items": len(items),
+        "articles": [
+            {
+                "title": item.title,
+                "date": item.pub_date.date().isoformat() if item.pub_date else None,
+                "url": item.link,
+                "summary": _clean_html(item.description)[:200],
+            }
+            for item in items
+        ],
+    }
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+
+def _fmt_dt(d: datetime) -> str:
+    """Format a datetime as 'YYYY-MM-DD HH:MM:SS UTC' without strftime."""
+    return (
+        f"{d.year:04d}-{d.month:02d}-{d.day:02d} "
+        f"{d.hour:02d}:{d.minute:02d}:{d.second:02d} UTC"
+    )
 
 
 def _clean_html(text: str) -> str:
@@ -128,14 +145,4 @@ def _clean_html(text: str) -> str:
     Returns:
         Plain text with HTML removed
     """
-    import re
-    from html import unescape
-
-    # Remove HTML tags
-    text = re.sub(r"<[^>]+>", "", text)
-    # Decode HTML entities
-    text = unescape(text)
-    # Clean up whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
-
+    return _WS_RE.sub(" ", unescape(_TAG_RE.sub("", text))).strip()
@@ -1,71 +1,71 @@
 """RSS feed parser module."""
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional
-from xml.etree import ElementTree
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+from itertools import islice
+from typing import Callable, Iterator, Optional
+from urllib.parse import urlparse
 
-from dateutil import parser as date_parser
-from pydantic import BaseModel, Field, field_validator
+from lxml import etree
 
 logger = logging.getLogger(__name__)
 
 
-class NewsItem(BaseModel):
+@dataclass(slots=True)
+class NewsItem:
     """Model for a single news item from RSS feed."""
 
-    title: str = Field(..., description="Article title")
-    link: str = Field(..., description="Article URL")
-    description: str = Field(default="", description="Article description/summary")
-    pub_date: Optional[datetime] = Field(default=None, description="Publication date")
-    author: Optional[str] = Field(default=None, description="Article author")
-    guid: Optional[str] = Field(default=None, description="Unique identifier")
-    categories: list[str] = Field(default_factory=list, description="Article categories")
-
-    @field_validator("pub_date", mode="before")
-    @classmethod
-    def parse_pub_date(cls, v: Any) -> Optional[datetime]:
-        """Parse publication date from string."""
-        if v is None or v == "":
-            return None
-        if isinstance(v, datetime):
-            return v
-        try:
-            return date_parser.parse(str(v))
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Failed to parse date '{v}': {e}")
-            return None
-
-
-class FeedMetadata(BaseModel):
+    title: str  # Article title
+    link: str  # Article URL
+    description: str = ""  # Article description/summary
+    pub_date: Optional[datetime] = None  # Publication date
+    author: Optional[str] = None  # Article author
+    guid: Optional[str] = None  # Unique identifier
+    categories: list[str] = field(default_factory=list)  # Article categories
+
+
+@dataclass(slots=True)
+class FeedMetadata:
     """Model for RSS feed metadata."""
 
-    title: str = Field(..., description="Feed title")
-    link: str = Field(..., description="Feed website URL")
-    description: str = Field(default="", description="Feed description")
-    last_build_date: Optional[datetime] = Field(
-        default=None, description="Last build date"
-    )
-    language: Optional[str] = Field(default=None, description="Feed language")
+    title: str  # Feed title
+    link: str  # Feed website URL
+    description: str = ""  # Feed description
+    last_build_date: Optional[datetime] = None  # Last build date
+    language: Optional[str] = None  # Feed language
 
 
-class ParsedFeed(BaseModel):
+@dataclass(slots=True)
+class ParsedFeed:
     """Complete parsed RSS feed with metadata and items."""
 
     metadata: FeedMetadata
-    items: list[NewsItem] = Field(default_factory=list)
+    items: list[NewsItem] = field(default_factory=list)
+
+
+# Channel-level elements collected into FeedMetadata
+_CHANNEL_FIELDS = frozenset({"title", "link", "description", "lastBuildDate", "language"})
 
+# Item schemas accepted by parse_rss_feed; "auto" picks by channel link
+SCHEMAS = ("auto", "hn", "generic")
 
-def _extract_text(element: Optional[ElementTree.Element], default: str = "") -> str:
+# Channel hosts that publish The Hacker News item schema
+_HN_HOSTS = frozenset({"thehackernews.com", "www.thehackernews.com"})
+
+
+def _extract_text(element: Optional[etree._Element], default: str = "") -> str:
     """Extract text content from XML element."""
     if element is None:
         return default
-    text = element.text or ""
+    text: str = element.text or ""
     if element.tail:
         text += element.tail
     return text.strip()
 
 
-def _extract_cdata(element: Optional[ElementTree.Element]) -> str:
+def _extract_cdata(element: Optional[etree._Element]) -> str:
     """Extract CDATA content from XML element."""
     if element is None:
         return ""
@@ -73,90 +73,259 @@ def _extract_cdata(element: Optional[ElementTree.Element]) -> str:
     if element.text:
         return element.text.strip()
     # Fallback to concatenating all text
-    return "".join(element.itertext()).strip()
+    return "".join(t for t in element.itertext() if isinstance(t, str)).strip()
 
 
 def _parse_date(date_str: Optional[str]) -> Optional[datetime]:
-    """Parse date string to datetime object."""
+    """
+    Parse date string to datetime object.
+
+    RSS dates are RFC 822, which email.utils parses directly; dateutil's
+    heuristic parser is only tried for feeds that use some other format.
+    """
     if not date_str:
         return None
     try:
-        return date_parser.parse(date_str)
+        return parsedate_to_datetime(date_str)
     except (ValueError, TypeError):
+        pass
+    # Deferred: dateutil is slow to import and rarely needed
+    from dateutil import parser as date_parser
+
+    try:
+        return date_parser.parse(date_str)
+    except (ValueError, TypeError, OverflowError):
+        logger.warning(f"Failed to parse date '{date_str}'")
+        return None
+
+
+def _parse_channel_metadata(feed_content: bytes) -> FeedMetadata:
+    """
+    Extract channel metadata in a single streaming pass.
+
+    Stops at the first ``<item>`` so item bodies are never materialized.
+
+    Raises:
+        etree.XMLSyntaxError: On invalid XML
+        ValueError: If the root element has no 'channel' child
+    """
+    fields: dict[str, str] = {}
+    has_channel: bool = False
+
+    context = etree.iterparse(BytesIO(feed_content), events=("start", "end"))
+    for event, elem in context:
+        if event == "start":
+            if elem.tag == "item":
+                break
+            parent = elem.getparent()
+            if elem.tag == "channel" and parent is not None and parent.getparent() is None:
+                has_channel = True
+            continue
+
+        parent = elem.getparent()
+        if parent is not None and parent.tag == "channel" and elem.tag in _CHANNEL_FIELDS:
+            # Keep the first occurrence, matching ElementTree's find()
+            fields.setdefault(elem.tag, _extract_text(elem))
+
+    if not has_channel:
+        raise ValueError("RSS feed missing required 'channel' element")
+
+    return FeedMetadata(
+        title=fields.get("title", "Unknown Feed"),
+        link=fields.get("link", ""),
+        description=fields.get("description", ""),
+        last_build_date=_parse_date(fields.get("lastBuildDate")),
+        language=fields.get("language", ""),
+    )
+
+
+def _build_item(item_elem: etree._Element) -> Optional[NewsItem]:
+    """
+    Build a NewsItem from an ``<item>`` element.
+
+    The item's children are walked once, dispatching on tag. Repeated
+    single-valued children keep their first occurrence, matching
+    ElementTree's find().
+
+    Returns:
+        NewsItem, or None if the item lacks a title or link
+    """
+    title: Optional[str] = None
+    link: Optional[str] = None
+    description: Optional[str] = None
+    pub_date_str: Optional[str] = None
+    author: Optional[str] = None
+    guid: Optional[str] = None
+    categories: list[str] = []
+    for child in item_elem:
+        tag = child.tag
+        if tag == "title":
+            if title is None:
+                title = _extract_text(child)
+        elif tag == "link":
+            if link is None:
+                link = _extract_text(child)
+        elif tag == "description":
+            if description is None:
+                description = _extract_cdata(child)
+        elif tag == "pubDate":
+            if pub_date_str is None:
+                pub_date_str = _extract_text(child)
+        elif tag == "author":
+            if author is None:
+                author = _extract_text(child)
+        elif tag == "guid":
+            if guid is None:
+                guid = _extract_text(child)
+        elif tag == "category":
+            category: str = _extract_text(child)
+            if category:
+                categories.append(category)
+
+    if not title or not link:  # Only keep items with required fields
         return None
 
+    return NewsItem(
+        title=title,
+        link=link,
+        description=description or "",
+        pub_date=_parse_date(pub_date_str),
+        author=author if author else None,
+        guid=guid,
+        categories=categories,
+    )
+
 
-def parse_rss_feed(*, feed_content: bytes, encoding: str = "utf-8") -> ParsedFeed:
+def _build_item_hn(item_elem: etree._Element) -> Optional[NewsItem]:
+    """
+    Build a NewsItem assuming The Hacker News item schema.
+
+    The schema is one plain-text child per field, no categories and an
+    RFC 822 pubDate, which lets the item be read into a dict in one pass and
+    its date parsed without the dateutil fallback. Items that do not match
+    are handed to _build_item.
+
+    Returns:
+        NewsItem, or None if the item lacks a title or link
+    """
+    fields: dict[object, Optional[str]] = {}
+    for child in item_elem:
+        if child.tag == "category" or len(child):
+            return _build_item(item_elem)
+        fields.setdefault(child.tag, child.text)  # First occurrence wins
+
+    title = (fields.get("title") or "").strip()
+    link = (fields.get("link") or "").strip()
+    if not title or not link:  # Only keep items with required fields
+        return None
+
+    try:
+        pub_date: Optional[datetime] = parsedate_to_datetime(fields["pubDate"] or "")
+    except (KeyError, TypeError, ValueError):
+        return _build_item(item_elem)
+
+    author = (fields.get("author") or "").strip()
+    guid = (fields["guid"] or "").strip() if "guid" in fields else None
+    return NewsItem(
+        title=title,
+        link=link,
+        description=(fields.get("description") or "").strip(),
+        pub_date=pub_date,
+        author=author if author else None,
+        guid=guid,
+        categories=[],
+    )
+
+
+def _select_item_builder(
+    schema: str, metadata: FeedMetadata
+) -> Callable[[etree._Element], Optional[NewsItem]]:
+    """
+    Pick the item builder for a schema name.
+
+    Raises:
+        ValueError: On an unknown schema name
+    """
+    if schema not in SCHEMAS:
+        raise ValueError(f"Unknown schema '{schema}', expected one of {', '.join(SCHEMAS)}")
+    if schema == "auto":
+        is_hn = urlparse(metadata.link).hostname in _HN_HOSTS
+        schema = "hn" if is_hn else "generic"
+    return _build_item_hn if schema == "hn" else _build_item
+
+
+def _iter_item_elements(feed_content: bytes) -> Iterator[etree._Element]:
+    """
+    Stream the channel's ``<item>`` elements.
+
+    Each item is cleared, together with already-handled siblings, once the
+    consumer asks for the next one.
+
+    Raises:
+        etree.XMLSyntaxError: On invalid XML
+    """
+    context = etree.iterparse(
+        BytesIO(feed_content),
+        events=("end",),
+        tag="item",
+        huge_tree=False,
+    )
+    for _, item_elem in context:
+        parent = item_elem.getparent()
+        if parent is None or parent.tag != "channel":
+            continue
+
+        yield item_elem
+
+        # Release the processed item and any already-handled siblings
+        item_elem.clear()
+        while item_elem.getprevious() is not None:
+            del parent[0]
+
+
+def parse_rss_feed(
+    *,
+    feed_content: bytes,
+    encoding: str = "utf-8",
+    max_items: Optional[int] = None,
+    schema: str = "auto",
+) -> ParsedFeed:
     """
     Parse RSS feed XML content into structured data.
 
+    Items are streamed with ``lxml.etree.iterparse`` and cleared once
+    processed, so memory stays proportional to a single item rather than
+    the whole feed. When max_items is given, parsing stops as soon as that
+    many items have been collected; the rest of the document is not read
+    (nor checked for well-formedness).
+
     Args:
         feed_content: Raw bytes of RSS feed XML
         encoding: Character encoding (default: utf-8)
+        max_items: Maximum number of items to parse (None or <= 0 for all)
+        schema: Item schema to assume: "hn" for The Hacker News fast path
+            (items that do not match fall back to generic parsing),
+            "generic", or "auto" to choose from the channel link
 
     Returns:
         ParsedFeed object with metadata and items
 
     Raises:
-        ElementTree.ParseError: On invalid XML
-        ValueError: On missing required feed elements
+        etree.XMLSyntaxError: On invalid XML
+        ValueError: On missing required feed elements or an unknown schema
     """
+    limit: Optional[int] = max_items if max_items is not None and max_items > 0 else None
+
     try:
-        root = ElementTree.fromstring(feed_content)
-    except ElementTree.ParseError as e:
+        metadata = _parse_channel_metadata(feed_content)
+        build_item = _select_item_builder(schema, metadata)
+        built_items = map(build_item, _iter_item_elements(feed_content))
+        items: list[NewsItem] = list(
+            islice((item for item in built_items if item is not None), limit)
+        )
+    except etree.XMLSyntaxError as e:
         logger.error(f"Failed to parse XML: {e}")
         raise
 
-    # Handle RSS 2.0 format
-    channel = root.find("channel")
-    if channel is None:
-        raise ValueError("RSS feed missing required 'channel' element")
-
-    # Extract metadata
-    title_elem = channel.find("title")
-    link_elem = channel.find("link")
-    desc_elem = channel.find("description")
-    build_date_elem = channel.find("lastBuildDate")
-    lang_elem = channel.find("language")
-
-    metadata = FeedMetadata(
-        title=_extract_text(title_elem, "Unknown Feed"),
-        link=_extract_text(link_elem, ""),
-        description=_extract_text(desc_elem, ""),
-        last_build_date=_parse_date(_extract_text(build_date_elem)),
-        language=_extract_text(lang_elem),
-    )
-
-    # Extract items
-    items = []
-    for item_elem in channel.findall("item"):
-        title = _extract_text(item_elem.find("title"), "")
-        link = _extract_text(item_elem.find("link"), "")
-        description = _extract_cdata(item_elem.find("description"))
-        pub_date = _parse_date(_extract_text(item_elem.find("pubDate")))
-        author = _extract_text(item_elem.find("author"))
-        guid_elem = item_elem.find("guid")
-        guid = _extract_text(guid_elem) if guid_elem is not None else None
-
-        # Extract categories
-        categories = [
-            _extract_text(cat_elem)
-            for cat_elem in item_elem.findall("category")
-            if _extract_text(cat_elem)
-        ]
-
-        if title and link:  # Only add items with required fields
-            news_item = NewsItem(
-                title=title,
-                link=link,
-                description=description,
-                pub_date=pub_date,
-                author=author if author else None,
-                guid=guid,
-                categories=categories,
-            )
-            items.append(news_item)
-
     logger.info(f"Parsed {len(items)} news items from feed")
     return ParsedFeed(metadata=metadata, items=items)
-
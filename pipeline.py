@@ -0,0 +1,121 @@
+"""Concurrent fetch-and-parse pipeline for multiple RSS feeds."""
+import asyncio
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Optional, cast
+
+from lxml import etree
+
+from feed_fetcher import fetch_rss_feed
+from parser import ParsedFeed, parse_rss_feed
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_in_worker(content: bytes, max_items: Optional[int]) -> ParsedFeed:
+    """
+    Parse feed content in a pool worker.
+
+    lxml's XMLSyntaxError cannot be pickled back to the parent process (the
+    pool would replace it with a TypeError), so it is re-raised as ValueError.
+
+    Raises:
+        ValueError: On invalid XML or missing required feed elements
+    """
+    try:
+        return parse_rss_feed(feed_content=content, max_items=max_items)
+    except etree.XMLSyntaxError as e:
+        raise ValueError(f"Invalid XML: {e}") from None
+
+
+async def fetch_and_parse_feeds(
+    *,
+    feed_urls: list[str],
+    timeout: float = 30.0,
+    max_retries: int = 3,
+    concurrency: int = 10,
+    max_items: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    use_cache: bool = False,
+) -> list[ParsedFeed | BaseException]:
+    """
+    Fetch and parse several RSS feeds, overlapping network I/O with parsing.
+
+    Fetches run concurrently on the event loop and hand their content to a
+    bounded queue; consumers parse it in a process pool so CPU-bound parsing
+    of one feed proceeds while others are still downloading. The queue bound
+    applies back-pressure so at most a few fetched bodies wait in memory.
+
+    Args:
+        feed_urls: URLs of the RSS feeds to fetch
+        timeout: Request timeout in seconds
+        max_retries: Maximum number of retry attempts per feed
+        concurrency: Maximum number of feeds fetched at the same time
+        max_items: Maximum number of items to parse per feed (None for all)
+        max_workers: Parser processes (default: number of CPUs)
+        use_cache: Revalidate each feed against the on-disk cache
+
+    Returns:
+        One entry per URL, in input order: the ParsedFeed, or the exception
+        raised while fetching or parsing that feed (invalid XML is reported
+        as ValueError)
+
+    Raises:
+        ValueError: If concurrency is less than 1
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    workers = max_workers or os.cpu_count() or 1
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    queue: asyncio.Queue[Optional[tuple[int, bytes]]] = asyncio.Queue(
+        maxsize=concurrency * 2
+    )
+    results: list[ParsedFeed | BaseException | None] = [None] * len(feed_urls)
+
+    async def produce(index: int, feed_url: str) -> None:
+        async with semaphore:
+            try:
+                feed_data = await fetch_rss_feed(
+                    feed_url=feed_url,
+                    timeout=timeout,
+                    max_retries=max_retries,
+                    use_cache=use_cache,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to fetch {feed_url}: {e}")
+                results[index] = e
+                return
+        content = feed_data["content"]
+        assert isinstance(content, bytes)  # fetch_rss_feed always returns bytes content
+        await queue.put((index, content))
+
+    async def consume(pool: ProcessPoolExecutor) -> None:
+        while (entry := await queue.get()) is not None:
+            index, content = entry
+            try:
+                results[index] = await loop.run_in_executor(
+                    pool, partial(_parse_in_worker, content, max_items)
+                )
+            except Exception as e:
+                logger.warning(f"Failed to parse {feed_urls[index]}: {e}")
+                results[index] = e
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        consumers = [asyncio.create_task(consume(pool)) for _ in range(workers)]
+        try:
+            await asyncio.gather(
+                *(produce(index, feed_url) for index, feed_url in enumerate(feed_urls))
+            )
+            for _ in consumers:
+                await queue.put(None)
+            await asyncio.gather(*consumers)
+        finally:
+            for consumer in consumers:
+                consumer.cancel()
+
+    # Every slot has been filled by produce() or consume() at this point
+    return cast(list[ParsedFeed | BaseException], results)